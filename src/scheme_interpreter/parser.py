@@ -1,13 +1,67 @@
-def number_node(value: float) -> dict:
-    return {"type": "number", "name": value}
+import string
+import sys
+from functools import lru_cache
 
+from scheme_interpreter.tokeniser import tokenise
 
-def symbol_node(name: str) -> dict:
-    return {"type": "symbol", "name": name}
 
+class _FrozenNode:
+    """Base for AST nodes: attributes are set once, in __init__"""
 
-def list_node(elements: list) -> dict:
-    return {"type": "list", "elements": elements}
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class SymbolNode(_FrozenNode):
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        object.__setattr__(self, "name", name)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SymbolNode):
+            return NotImplemented
+        return self.name == other.name
+
+    def __repr__(self) -> str:
+        return f"SymbolNode({self.name!r})"
+
+
+class ListNode(_FrozenNode):
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: "tuple | list") -> None:
+        # tuple() returns a tuple argument itself, so parse_list's tuples
+        # are stored without a second copy
+        object.__setattr__(self, "elements", tuple(elements))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ListNode):
+            return NotImplemented
+        return self.elements == other.elements
+
+    def __repr__(self) -> str:
+        return f"ListNode({self.elements!r})"
+
+
+def number_node(value: "str | float") -> float:
+    # Numbers need no wrapper: a float is told apart from the other nodes
+    # by its type. This is the one place tokens are converted to numbers.
+    return float(value)
+
+
+def symbol_node(name: str) -> SymbolNode:
+    # Repeated identifiers share one string object
+    return SymbolNode(sys.intern(name))
+
+
+def list_node(elements: "tuple | list") -> ListNode:
+    return ListNode(elements)
 
 
 class ParseError(Exception):
@@ -16,11 +70,31 @@ class ParseError(Exception):
     pass
 
 
+# ASCII characters that can start something float() accepts: a sign, a
+# point, a digit, leading whitespace, or the i/n of inf and nan
+_NUM_START = frozenset(string.digits + string.whitespace + "+-.iInN")
+
+
+# Screened-in tokens that float() rejected ("+", "if", "null?", ...), so
+# each pays for a ValueError only once; bounded so it cannot grow forever
+_NON_NUMBERS: set = set()
+_NON_NUMBERS_MAX = 4096
+
+
 def is_number(token: str) -> bool:
+    # Most symbols are rejected on their first character alone
+    if isinstance(token, str):
+        first = token[:1]
+        if first.isascii() and first not in _NUM_START:
+            return False
+    if token in _NON_NUMBERS:
+        return False
     try:
         float(token)
         return True
     except ValueError:
+        if len(_NON_NUMBERS) < _NON_NUMBERS_MAX:
+            _NON_NUMBERS.add(token)
         return False
 
 
@@ -37,7 +111,7 @@ def parse_number(tokens: list[str], position: int) -> tuple:
     if not is_number(token):
         raise ParseError(f"Expected number, got {token}")
 
-    node = number_node(float(token))
+    node = number_node(token)
     new_position = position + 1
     return node, new_position
 
@@ -60,30 +134,40 @@ def parse_list(tokens: list, position: int) -> tuple:
     """
     Parse a list expression: (element1 element2 ...)
     Returns: (list_node, new_position)
+
+    Nested lists are handled with an explicit stack rather than recursion,
+    so nesting depth is not limited by the Python call stack.
     """
 
     if position >= len(tokens) or tokens[position] != "(":
         raise ParseError("Expected opening parenthesis")
 
-    # Skip opening parenthesis
-    position += 1
+    # Elements of every list still open, innermost last; `elements` is
+    # always the innermost one
     elements = []
-
-    # Parse elements until closing parenthesis
-    while position < len(tokens) and tokens[position] != ")":
-        element_node, position = parse_expression(
-            tokens, position
-        )  # Recursion?
-        elements.append(element_node)
-
-    # Check for closing parenthesis
-    if position >= len(tokens):
-        raise ParseError("Missing closing parenthesis")
-
-    # Skip closing parenthesis
-    position += 1
-
-    return list_node(elements), position
+    stack = [elements]
+
+    # Walk the tokens after the opening parenthesis; range starts in O(1),
+    # so parsing forms one after another from a long token list stays linear
+    for position in range(position + 1, len(tokens)):
+        token = tokens[position]
+
+        if token == "(":
+            elements = []
+            stack.append(elements)
+        elif token == ")":
+            # The list is closed, so freeze its elements here, once
+            node = list_node(tuple(stack.pop()))
+            if not stack:
+                return node, position + 1
+            elements = stack[-1]
+            elements.append(node)
+        elif is_number(token):
+            elements.append(number_node(token))
+        else:
+            elements.append(symbol_node(token))
+
+    raise ParseError("Missing closing parenthesis")
 
 
 def parse_expression(tokens: list[str], position: int) -> tuple:
@@ -105,3 +189,20 @@ def parse_expression(tokens: list[str], position: int) -> tuple:
         return parse_number(tokens, position)
     else:
         return parse_symbol(tokens, position)
+
+
+@lru_cache(maxsize=1024)
+def parse_source(source: str) -> "float | SymbolNode | ListNode":
+    """
+    Tokenise and parse a source string holding exactly one expression.
+
+    Results are cached per source string and the same tree is returned to
+    every caller; this is safe because nodes are immutable.
+    """
+    tokens = tokenise(source)
+    node, position = parse_expression(tokens, 0)
+
+    if position < len(tokens):
+        raise ParseError(f"Unexpected token after expression: {tokens[position]}")
+
+    return node
@@ -1,42 +1,24 @@
-# test_case = '(string-append "Hello" " " "world")'
-test_case = "(substring str 0 (- (string-length str) 3))"
-# test_case = ""
+import re
 
-if test_case:
-    print("test_case:", test_case)
-else:
-    print("No test case provided.")
+# A line comment, or a token: a string literal, a parenthesis, or a run of
+# anything else up to whitespace or a comment. Comments match outside the
+# token group, so findall yields "" for them.
+_TOKEN_RE = re.compile(r';[^\n]*|("[^"]*"|[()]|[^\s()";]+|"[^\s();]*)')
+_find_tokens = _TOKEN_RE.findall
 
+# With an odd number of quotes they cannot all pair up, so quotes are treated
+# as ordinary characters: tokens are parentheses or runs up to whitespace
+_UNPAIRED_QUOTES_RE = re.compile(r';[^\n]*|([()]|[^\s();]+)')
+_find_unpaired_quote_tokens = _UNPAIRED_QUOTES_RE.findall
 
-def tokenise(input: str) -> list[str]:
-    def regular_tokeniser(input: str) -> list[str]:
-        return input.replace("(", " ( ").replace(")", " ) ").strip().split()
-
-    def quoted_pair_tokeniser(input: str) -> list[str]:
-        first_quote = input.find('"')
-        second_quote = input.find('"', first_quote + 1)
-
-        pre_quoted_substring = input[:first_quote]
-        quoted_substring_preserved = input[first_quote : second_quote + 1]
-        post_quoted_substring = input[second_quote + 1 :]
-
-        result = []
-        if pre_quoted_substring.strip():
-            result.extend(regular_tokeniser(pre_quoted_substring))
-        result.append(quoted_substring_preserved)
-        if post_quoted_substring.strip():
-            result.extend(tokenise(post_quoted_substring))
-        return result
 
+def tokenise(input: str) -> list[str]:
     if not input:
         return []
-    if '"' not in input:
-        return regular_tokeniser(input)
-    if input.count('"') % 2 != 0:
-        # Unpaired quotes - so handle as regular tokens
-        return regular_tokeniser(input)
-
-    return quoted_pair_tokeniser(input)
-
-
-print("tokeniser_output:", tokenise(test_case))
+    if '"' in input and input.count('"') % 2 != 0:
+        tokens = _find_unpaired_quote_tokens(input)
+    else:
+        tokens = _find_tokens(input)
+    if ";" not in input:
+        return tokens
+    return [token for token in tokens if token]
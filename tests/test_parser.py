@@ -1,7 +1,10 @@
 import pytest
 from scheme_interpreter.parser import (
+    ParseError,
+    is_number,
     list_node,
     parse_expression,
+    parse_source,
     number_node,
     symbol_node,
 )
@@ -25,6 +28,82 @@ def test_parse_empty_list():
     assert new_position == 2  # Consumed both tokens "(" ")"
 
 
+def test_parse_nested_list():
+    tokens = ["(", "+", "1", "(", "*", "2", "3", ")", ")"]
+    result_node, new_position = parse_expression(tokens, 0)
+
+    expected_node = list_node(
+        [
+            symbol_node("+"),
+            number_node(1.0),
+            list_node([symbol_node("*"), number_node(2.0), number_node(3.0)]),
+        ]
+    )
+    assert result_node == expected_node
+    assert new_position == 9
+
+
+def test_parse_deeply_nested_list():
+    depth = 10_000
+    tokens = ["("] * depth + [")"] * depth
+    result_node, new_position = parse_expression(tokens, 0)
+
+    assert new_position == 2 * depth
+    for _ in range(depth - 1):
+        (result_node,) = result_node.elements
+    assert result_node == list_node([])
+
+
+def test_parse_many_forms_from_one_token_list():
+    """
+    Parse forms one after another from a single token list.
+
+    Each parse_list call must start at its position in constant time;
+    otherwise this loop is quadratic in the number of forms.
+    """
+    forms = 100_000
+    tokens = ["(", "f", "1", ")"] * forms
+
+    position = 0
+    parsed = 0
+    while position < len(tokens):
+        result_node, position = parse_expression(tokens, position)
+        parsed += 1
+
+    assert parsed == forms
+    assert position == len(tokens)
+    assert result_node == list_node([symbol_node("f"), number_node(1.0)])
+
+
+@pytest.mark.parametrize(
+    "tokens",
+    [
+        ["("],
+        ["(", "+", "1"],
+        ["(", "(", ")"],
+    ],
+)
+def test_parse_missing_closing_parenthesis(tokens: list[str]):
+    with pytest.raises(ParseError):
+        parse_expression(tokens, 0)
+
+
+def test_node_types_are_distinct():
+    assert number_node(1.0) != symbol_node("1")
+    assert symbol_node("x") != list_node(["x"])
+
+
+def test_symbol_names_are_interned():
+    # Build equal but distinct string objects, as a tokeniser would
+    first, second = "".join(["coun", "ter"]), "".join(["cou", "nter"])
+    assert first is not second
+
+    result_node, _ = parse_expression(["(", first, second, ")"], 0)
+
+    first_node, second_node = result_node.elements
+    assert first_node.name is second_node.name
+
+
 # Symbols
 @pytest.mark.parametrize(
     "input_tokens",
@@ -60,4 +139,63 @@ def test_parse_single_number_variants(input_tokens):
     tokens = [input_tokens]
     result_node, new_position = parse_expression(tokens, 0)
     assert result_node == number_node(input_tokens)
+    assert type(result_node) is float
     assert new_position == 1
+
+
+@pytest.mark.parametrize(
+    "token,expected",
+    [
+        ("42", True),
+        ("-3.14", True),
+        ("+.5", True),
+        ("1e3", True),
+        ("+", False),
+        ("-", False),
+        ("...", False),
+        ("define", False),
+        ('"42"', False),
+    ],
+)
+def test_is_number(token: str, expected: bool):
+    assert is_number(token) is expected
+
+
+def test_parse_source():
+    result_node = parse_source("(+ 1 (* x 2))")
+
+    expected_node = list_node(
+        [
+            symbol_node("+"),
+            number_node(1.0),
+            list_node([symbol_node("*"), symbol_node("x"), number_node(2.0)]),
+        ]
+    )
+    assert result_node == expected_node
+
+
+def test_parse_source_is_cached():
+    assert parse_source("(display 42)") is parse_source("(display 42)")
+
+
+def test_parse_source_tree_cannot_be_changed():
+    result_node = parse_source("(f (g 1))")
+
+    with pytest.raises(AttributeError):
+        result_node.elements.append(symbol_node("x"))
+    with pytest.raises(AttributeError):
+        result_node.elements = []
+    with pytest.raises(AttributeError):
+        result_node.elements[0].name = "h"
+    with pytest.raises(TypeError):
+        result_node.elements[1].elements[0] = symbol_node("h")
+
+    assert parse_source("(f (g 1))") == list_node(
+        [symbol_node("f"), list_node([symbol_node("g"), number_node(1.0)])]
+    )
+
+
+@pytest.mark.parametrize("source", ["", "1 2", "(+ 1 2))"])
+def test_parse_source_rejects_other_than_one_expression(source: str):
+    with pytest.raises(ParseError):
+        parse_source(source)
@@ -87,6 +87,18 @@ def test_tokenise_whitespaces(input_text: str, expected: list[str]):
                 ")",
             ],
         ),
+        (
+            "(+(f)x)",
+            [
+                "(",
+                "+",
+                "(",
+                "f",
+                ")",
+                "x",
+                ")",
+            ],
+        ),
     ],
 )
 def test_tokenise_parentheses(input_text: str, expected: list[str]):
@@ -127,8 +139,96 @@ def test_tokenise_parentheses(input_text: str, expected: list[str]):
                 ")",
             ],
         ),
+        (
+            '(list "(a b)" x "" "c d")',
+            [
+                "(",
+                "list",
+                '"(a b)"',
+                "x",
+                '""',
+                '"c d"',
+                ")",
+            ],
+        ),
+        (
+            '(display "Hello)',
+            [
+                "(",
+                "display",
+                '"Hello',
+                ")",
+            ],
+        ),
     ],
 )
 def test_tokenise_string(input_text: str, expected: list[str]):
     result = tokenise(input_text)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "input_text,expected",
+    [
+        ('a"b', ['a"b']),
+        ('(f a"b c)', ["(", "f", 'a"b', "c", ")"]),
+        (
+            '(a "b c) "d"',
+            [
+                "(",
+                "a",
+                '"b',
+                "c",
+                ")",
+                '"d"',
+            ],
+        ),
+    ],
+)
+def test_tokenise_unpaired_quotes(input_text: str, expected: list[str]):
+    """
+    With an odd number of quotes, quotes are ordinary characters and
+    tokens split on whitespace and parentheses only.
+    """
+    result = tokenise(input_text)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "input_text,expected",
+    [
+        ("; a comment", []),
+        ("42 ; the answer", ["42"]),
+        (
+            "; String -> Player\n(make-player name)",
+            [
+                "(",
+                "make-player",
+                "name",
+                ")",
+            ],
+        ),
+        (
+            "(+ 1;one\n 2)",
+            [
+                "(",
+                "+",
+                "1",
+                "2",
+                ")",
+            ],
+        ),
+        (
+            '(display "a; b")',
+            [
+                "(",
+                "display",
+                '"a; b"',
+                ")",
+            ],
+        ),
+    ],
+)
+def test_tokenise_comments(input_text: str, expected: list[str]):
+    result = tokenise(input_text)
+    assert result == expected